@@ -13,6 +13,8 @@ import random
 class Config:
     """Simple configuration class for testing"""
     
+    __slots__ = ('trading_params',)
+    
     def __init__(self):
         self.trading_params = {
             'amount_per_trade': 100.0,
@@ -49,6 +51,13 @@ class Config:
 class TradingParams:
     """Mock trading parameters class (no GUI)"""
     
+    __slots__ = (
+        'config', 'amount_per_trade', 'max_position_size', 'stop_loss_percentage',
+        'take_profit_percentage', 'default_leverage', 'enable_stop_loss', 'enable_take_profit',
+        'use_signal_leverage', 'max_leverage', 'min_market_cap', 'enable_market_cap_filter',
+        'enable_auto_trading', 'auto_close_trades', 'max_simultaneous_trades',
+    )
+    
     def __init__(self, config):
         """Initialize with a configuration object"""
         self.config = config
@@ -2,7 +2,20 @@
 Main package initialization file
 """
 
-# Import main components for easier imports
-from .screen_capture import ScreenCapture
-from .signal_parser import SignalParser
-from .trading_client import PhemexClient
+import importlib
+
+# Main components are imported on first access, so importing a single submodule
+# (e.g. src.input_controller) doesn't pull in OpenCV, PyAutoGUI and Tesseract
+_LAZY_IMPORTS = {
+    'ScreenCapture': '.screen_capture',
+    'SignalParser': '.signal_parser',
+    'PhemexClient': '.trading_client',
+}
+
+def __getattr__(name):
+    """Import main components for easier imports"""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
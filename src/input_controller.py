@@ -8,11 +8,14 @@ import time
 import atexit
 import os
 import platform
-import pyautogui
+import importlib
+import functools
 from enum import Enum
 
-# Try to import mac-specific controller
+# Try to import mac-specific controller (it drives input through osascript, so only on macOS)
 try:
+    if platform.system() != "Darwin":
+        raise ImportError("macOS controller requires macOS")
     import src.mac_controller as mac_controller
     MAC_CONTROLLER_AVAILABLE = True
 except ImportError:
@@ -37,18 +40,55 @@ if platform.system() == "Darwin" and MAC_CONTROLLER_AVAILABLE:
 # Current active controller
 _active_controller = None
 
+# Set when no controller backend could be loaded, so get_controller fails fast instead of retrying
+_no_controller_error = None
+
+# PyAutoGUI (and the PIL stack it pulls in) is imported on first use
+pyautogui = None
+
+def _load_pyautogui():
+    """
+    Import PyAutoGUI on first use
+    
+    Returns:
+        module: The pyautogui module
+    """
+    global pyautogui
+    if pyautogui is None:
+        pyautogui = importlib.import_module('pyautogui')
+    return pyautogui
+
+def _load_mac_controller():
+    """
+    Return the macOS controller module (imported at startup when available)
+    
+    Returns:
+        module: The mac_controller module
+    """
+    if not MAC_CONTROLLER_AVAILABLE:
+        raise ImportError("macOS controller is not available")
+    return mac_controller
+
+# Backend each controller type needs up front; HYBRID only loads PyAutoGUI if it falls back
+_CONTROLLER_LOADERS = {
+    ControllerType.PYAUTOGUI: _load_pyautogui,
+    ControllerType.MACOS_NATIVE: _load_mac_controller,
+    ControllerType.HYBRID: _load_mac_controller,
+}
+
 def _emergency_cleanup():
     """Global emergency cleanup to release resources"""
     try:
-        # Release PyAutoGUI resources
-        pyautogui.mouseUp()
-        pyautogui.keyUp('shift')
-        pyautogui.keyUp('ctrl')
-        pyautogui.keyUp('alt')
-        
-        # Move cursor to a safe location
-        screen_width, screen_height = pyautogui.size()
-        pyautogui.moveTo(screen_width // 2, screen_height // 2, duration=0.1)
+        # Release PyAutoGUI resources (only if it was ever loaded)
+        if pyautogui is not None:
+            pyautogui.mouseUp()
+            pyautogui.keyUp('shift')
+            pyautogui.keyUp('ctrl')
+            pyautogui.keyUp('alt')
+            
+            # Move cursor to a safe location
+            screen_width, screen_height = pyautogui.size()
+            pyautogui.moveTo(screen_width // 2, screen_height // 2, duration=0.1)
         
         # If macOS controller is active, clean it up too
         if MAC_CONTROLLER_AVAILABLE:
@@ -69,7 +109,8 @@ def set_controller(controller_type=None):
         controller_type: ControllerType enum value or string name
         
     Returns:
-        bool: True if controller was set successfully
+        bool: True if controller was set successfully; on failure the previously
+              active controller (if any) stays active
     """
     global _active_controller
     
@@ -95,16 +136,57 @@ def set_controller(controller_type=None):
         logger.warning(f"macOS controller requested but not available. Using PyAutoGUI instead.")
         controller_type = ControllerType.PYAUTOGUI
     
+    # Load the backend for the selected controller
+    try:
+        _CONTROLLER_LOADERS[controller_type]()
+    except ImportError as e:
+        logger.error(f"Failed to load {controller_type.value} controller: {e}")
+        return False
+    
     # Set the active controller
     _active_controller = controller_type
     logger.info(f"Input controller set to: {_active_controller.value}")
     return True
 
+def _activate_available_controller():
+    """
+    Activate the first controller whose backend loads, starting with the default
+    
+    Returns:
+        ControllerType: The activated controller
+        
+    Raises:
+        RuntimeError: If no controller backend can be loaded
+    """
+    candidates = [DEFAULT_CONTROLLER] + [c for c in ControllerType if c is not DEFAULT_CONTROLLER]
+    if not MAC_CONTROLLER_AVAILABLE:
+        candidates = [ControllerType.PYAUTOGUI]
+    for controller_type in candidates:
+        if set_controller(controller_type):
+            return _active_controller
+    raise RuntimeError("No input controller is available (install PyAutoGUI: pip install pyautogui)")
+
 def get_controller():
-    """Get the current active controller type"""
-    global _active_controller
+    """
+    Get the current active controller type
+    
+    If no controller has been set yet, the first available one is activated.
+    
+    Returns:
+        ControllerType: The active controller (never None)
+        
+    Raises:
+        RuntimeError: If no controller backend can be loaded
+    """
+    global _no_controller_error
     if _active_controller is None:
-        set_controller()
+        if _no_controller_error is not None:
+            raise RuntimeError(_no_controller_error)
+        try:
+            _activate_available_controller()
+        except RuntimeError as e:
+            _no_controller_error = str(e)
+            raise
     return _active_controller
 
 def move_mouse(x, y, duration=0.2):
@@ -129,15 +211,36 @@ def move_mouse(x, y, duration=0.2):
                 return mac_controller.move_mouse(x, y, duration)
             except Exception as e:
                 logger.warning(f"macOS move failed ({e}), falling back to PyAutoGUI")
-                pyautogui.moveTo(x, y, duration=duration)
+                _load_pyautogui().moveTo(x, y, duration=duration)
                 return True
         else:  # PyAutoGUI
-            pyautogui.moveTo(x, y, duration=duration)
+            _load_pyautogui().moveTo(x, y, duration=duration)
             return True
     except Exception as e:
         logger.error(f"Failed to move mouse to ({x}, {y}): {e}")
         return False
 
+def move_mouse_path(points, dwell=0.5, duration=0.2):
+    """
+    Move the mouse through a sequence of points
+    
+    Args:
+        points: Iterable of (x, y) coordinates, visited in order
+        dwell: Time to pause at each point (seconds)
+        duration: Time to take for each movement (seconds)
+        
+    Returns:
+        bool: True if every movement succeeded
+    """
+    success = True
+    for x, y in points:
+        logger.debug("Moving to (%d, %d)", x, y)
+        if not move_mouse(x, y, duration):
+            success = False
+        if dwell:
+            time.sleep(dwell)
+    return success
+
 def click(x, y, duration=0.2):
     """
     Click at the specified coordinates
@@ -169,25 +272,26 @@ def click(x, y, duration=0.2):
             except Exception as e:
                 logger.warning(f"macOS click failed ({e}), falling back to PyAutoGUI")
                 # Use PyAutoGUI click with proper down/up sequence
-                pyautogui.moveTo(x, y, duration=0.2)
+                _load_pyautogui().moveTo(x, y, duration=0.2)
                 time.sleep(0.1)
-                pyautogui.mouseDown()
+                _load_pyautogui().mouseDown()
                 time.sleep(duration)
-                pyautogui.mouseUp()
+                _load_pyautogui().mouseUp()
                 return True
         else:  # PyAutoGUI
             # Use proper down/up sequence instead of simple click
-            pyautogui.moveTo(x, y, duration=0.2)
+            _load_pyautogui().moveTo(x, y, duration=0.2)
             time.sleep(0.1)
-            pyautogui.mouseDown()
+            _load_pyautogui().mouseDown()
             time.sleep(duration)
-            pyautogui.mouseUp()
+            _load_pyautogui().mouseUp()
             return True
     except Exception as e:
         logger.error(f"Failed to click at ({x}, {y}): {e}")
         # Always ensure mouse is released on error
         try:
-            pyautogui.mouseUp()
+            if pyautogui is not None:
+                pyautogui.mouseUp()
         except:
             pass
         return False
@@ -368,13 +472,38 @@ def capture_screenshot():
                     return Image.open(screenshot_path)
             except Exception as e:
                 logger.warning(f"macOS screenshot failed ({e}), falling back to PyAutoGUI")
-                return pyautogui.screenshot()
+                return _load_pyautogui().screenshot()
         else:  # PyAutoGUI
-            return pyautogui.screenshot()
+            return _load_pyautogui().screenshot()
     except Exception as e:
         logger.error(f"Failed to capture screenshot: {e}")
         return None
 
+@functools.lru_cache(maxsize=None)
+def _query_screen_size(controller):
+    """
+    Query the screen dimensions from a controller's backend
+    
+    Results are cached per controller type since the screen size does not change
+    within a session; failures raise and are not cached.
+    
+    Args:
+        controller: ControllerType to query
+        
+    Returns:
+        tuple: (width, height) of the screen
+    """
+    if controller == ControllerType.MACOS_NATIVE:
+        return mac_controller.get_screen_size()
+    elif controller == ControllerType.HYBRID:
+        try:
+            return mac_controller.get_screen_size()
+        except Exception as e:
+            logger.warning(f"macOS screen size failed ({e}), falling back to PyAutoGUI")
+            return _load_pyautogui().size()
+    else:  # PyAutoGUI
+        return _load_pyautogui().size()
+
 def get_screen_size():
     """
     Get the screen dimensions
@@ -385,24 +514,12 @@ def get_screen_size():
     controller = get_controller()
     
     try:
-        if controller == ControllerType.MACOS_NATIVE:
-            return mac_controller.get_screen_size()
-        elif controller == ControllerType.HYBRID:
-            try:
-                return mac_controller.get_screen_size()
-            except Exception as e:
-                logger.warning(f"macOS screen size failed ({e}), falling back to PyAutoGUI")
-                return pyautogui.size()
-        else:  # PyAutoGUI
-            return pyautogui.size()
+        return _query_screen_size(controller)
     except Exception as e:
         logger.error(f"Failed to get screen size: {e}")
         # Return a reasonable default
         return (1440, 900)
 
-# Initialize with default controller
-set_controller()
-
 # Test function
 def test_controllers():
     """Test all available controllers"""
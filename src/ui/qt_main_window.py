@@ -8,25 +8,36 @@ import sys
 import logging
 import threading
 import time
-from typing import Dict, Any, Optional, List
+from collections import deque
+from enum import IntEnum
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
 
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout,
+    QMainWindow, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QCheckBox, QPushButton, QFrame, QGroupBox, QTextEdit,
-    QSpinBox, QDoubleSpinBox, QListWidget, QSplitter, QTableWidget, QTableWidgetItem,
-    QScrollArea, QFormLayout, QMessageBox, QComboBox, QSlider
+    QSpinBox, QDoubleSpinBox, QListWidget, QSplitter, QTableView,
+    QScrollArea, QFormLayout, QMessageBox, QComboBox, QSlider, QStyledItemDelegate
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QIcon, QFont, QPixmap
 
-# Import application modules - update these paths as needed
-from src.screen_capture_enhanced import ScreenCapture
-from src.signal_parser import SignalParser
-from src.trading_client import PhemexClient
-from src.config_enhanced import Config
+# Application modules are only needed for type hints; the caller constructs
+# the instances, so skip importing them (and their dependencies) at runtime
+if TYPE_CHECKING:
+    from src.screen_capture_enhanced import ScreenCapture
+    from src.signal_parser import SignalParser
+    from src.trading_client import PhemexClient
+    from src.config_enhanced import Config
 
 logger = logging.getLogger(__name__)
 
+# Confirmation dialog buttons
+_YES = QMessageBox.StandardButton.Yes
+_NO = QMessageBox.StandardButton.No
+
+# Maximum number of signals kept in the history table
+MAX_HISTORY = 1000
+
 class SignalProcessingThread(QThread):
     """Thread for processing trading signals"""
     signal_detected = pyqtSignal(dict)
@@ -72,13 +83,138 @@ class SignalProcessingThread(QThread):
         self.running = False
         self.wait()
 
+class SignalStatus(IntEnum):
+    """Status of a signal in the history table"""
+    PENDING = 0
+    FILLED = 1
+    CANCELED = 2
+    OPEN = 3
+    CLOSED = 4
+
+class SignalStatusDelegate(QStyledItemDelegate):
+    """Item delegate that renders SignalStatus values by name"""
+    
+    def displayText(self, value, locale):
+        """Return the status name for an integer status value"""
+        if isinstance(value, int):
+            try:
+                return SignalStatus(value).name
+            except ValueError:
+                pass
+        return super().displayText(value, locale)
+
+class SignalHistoryModel(QAbstractTableModel):
+    """
+    Table model for the signal history, stored as one list per column
+    """
+    
+    HEADERS = ("Timestamp", "Trader", "Symbol", "Direction", "Entry", "SL", "TP", "Status")
+    
+    # Columns holding raw prices, formatted only when a cell is displayed
+    PRICE_COLUMNS = frozenset((4, 5, 6))
+    
+    # Column holding SignalStatus values, rendered by SignalStatusDelegate
+    STATUS_COLUMN = 7
+    
+    def __init__(self, max_rows=MAX_HISTORY, parent=None):
+        """
+        Initialize the model
+        
+        Args:
+            max_rows: Maximum number of rows kept before the oldest are dropped
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.max_rows = max_rows
+        
+        self._ts = []
+        self._trader = []
+        self._symbol = []
+        self._dir = []
+        self._entry = []
+        self._sl = []
+        self._tp = []
+        self._status = []
+        self._columns = (self._ts, self._trader, self._symbol, self._dir,
+                         self._entry, self._sl, self._tp, self._status)
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of signals in the history"""
+        return 0 if parent.isValid() else len(self._ts)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of history columns"""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the display value for a cell"""
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        
+        column = index.column()
+        value = self._columns[column][index.row()]
+        if column in self.PRICE_COLUMNS and isinstance(value, (int, float)):
+            return f"{value:.8g}"
+        if column == self.STATUS_COLUMN:
+            return int(value)
+        return value
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Return the column header labels"""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def append_rows(self, rows):
+        """
+        Append rows to the model, dropping the oldest rows beyond max_rows
+        
+        Args:
+            rows: List of tuples with one value per column
+        """
+        rows = rows[-self.max_rows:]
+        if not rows:
+            return
+        
+        excess = len(self._ts) + len(rows) - self.max_rows
+        if excess > 0:
+            self.beginRemoveRows(QModelIndex(), 0, excess - 1)
+            for column in self._columns:
+                del column[:excess]
+            self.endRemoveRows()
+        
+        first = len(self._ts)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for row in rows:
+            for column, value in zip(self._columns, row):
+                column.append(value)
+        self.endInsertRows()
+    
+    def clear(self):
+        """Remove all rows from the model"""
+        self.beginResetModel()
+        for column in self._columns:
+            column.clear()
+        self.endResetModel()
+
 class QtMainWindow(QMainWindow):
     """
     PyQt6-based main application window with macOS-optimized UI
     """
     
-    def __init__(self, screen_capture: ScreenCapture, signal_parser: SignalParser, 
-                trading_client: PhemexClient, config: Config):
+    # Latest signal display, formatted in one pass per signal
+    SIGNAL_TEMPLATE = (
+        "Trader: {}\n"
+        "Symbol: {}\n"
+        "Direction: {}\n"
+        "Entry: {}\n"
+        "Stop Loss: {}\n"
+        "Take Profit: {}\n"
+        "Time: {}"
+    )
+    
+    def __init__(self, screen_capture: "ScreenCapture", signal_parser: "SignalParser", 
+                trading_client: "PhemexClient", config: "Config"):
         """
         Initialize the main window
         
@@ -97,6 +233,12 @@ class QtMainWindow(QMainWindow):
         
         self.signal_processing_thread = None
         
+        # Set mirror of the target trader list for O(1) membership checks
+        self._trader_set = set()
+        
+        # Rows waiting to be flushed into the history table
+        self._pending_history = deque()
+        
         # Initialize UI
         self._init_ui()
         
@@ -374,12 +516,12 @@ class QtMainWindow(QMainWindow):
         layout = QVBoxLayout(history_tab)
         
         # Create table for trade history
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(8)
-        self.history_table.setHorizontalHeaderLabels([
-            "Timestamp", "Trader", "Symbol", "Direction", 
-            "Entry", "SL", "TP", "Status"
-        ])
+        self.history_model = SignalHistoryModel(MAX_HISTORY, self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
+        self.history_table.setItemDelegateForColumn(
+            SignalHistoryModel.STATUS_COLUMN, SignalStatusDelegate(self.history_table)
+        )
         
         # Set column widths
         header = self.history_table.horizontalHeader()
@@ -389,6 +531,12 @@ class QtMainWindow(QMainWindow):
         
         layout.addWidget(self.history_table)
         
+        # Coalesce history inserts so bursts of signals cost one model update (~10Hz)
+        self._history_flush_timer = QTimer(self)
+        self._history_flush_timer.setSingleShot(True)
+        self._history_flush_timer.setInterval(100)
+        self._history_flush_timer.timeout.connect(self._flush_signal_history)
+        
         # Add controls for history
         controls_layout = QHBoxLayout()
         
@@ -587,6 +735,7 @@ class QtMainWindow(QMainWindow):
         """Update the trader list with current target traders"""
         self.trader_list.clear()
         target_traders = self.config.get_target_traders()
+        self._trader_set = set(target_traders)
         for trader in target_traders:
             self.trader_list.addItem(trader)
     
@@ -606,7 +755,11 @@ class QtMainWindow(QMainWindow):
         current_traders = self.config.get_target_traders()
         
         # Add new traders that aren't already in the list
-        new_traders = [t for t in traders if t and t not in current_traders]
+        new_traders = []
+        for t in traders:
+            if t and t not in self._trader_set:
+                self._trader_set.add(t)
+                new_traders.append(t)
         if new_traders:
             current_traders.extend(new_traders)
             self.config.set_target_traders(current_traders)
@@ -622,13 +775,12 @@ class QtMainWindow(QMainWindow):
         if not selected_items:
             return
         
-        current_traders = self.config.get_target_traders()
-        
         # Remove selected traders
         for item in selected_items:
-            trader = item.text()
-            if trader in current_traders:
-                current_traders.remove(trader)
+            self._trader_set.discard(item.text())
+        
+        # Rebuild the ordered list in a single pass
+        current_traders = [t for t in self.config.get_target_traders() if t in self._trader_set]
         
         self.config.set_target_traders(current_traders)
         self.config.save()
@@ -657,26 +809,23 @@ class QtMainWindow(QMainWindow):
     def _refresh_history(self):
         """Refresh the trade history"""
         # Clear the table
-        self.history_table.setRowCount(0)
+        self.history_model.clear()
         
         # TODO: Implement fetching actual trade history from a storage source
         
         # For now, add some sample data
         sample_data = [
             {"timestamp": "2025-04-20 12:34:56", "trader": "@yramki", "symbol": "BTC", "direction": "LONG", 
-             "entry": "67500", "sl": "65200", "tp": "70000", "status": "OPEN"},
+             "entry": 67500.0, "sl": 65200.0, "tp": 70000.0, "status": SignalStatus.OPEN},
             {"timestamp": "2025-04-20 10:15:30", "trader": "@Tareeq", "symbol": "ETH", "direction": "SHORT", 
-             "entry": "3520", "sl": "3650", "tp": "3300", "status": "CLOSED"},
+             "entry": 3520.0, "sl": 3650.0, "tp": 3300.0, "status": SignalStatus.CLOSED},
             {"timestamp": "2025-04-19 15:45:12", "trader": "@yramki", "symbol": "SOL", "direction": "LONG", 
-             "entry": "150.25", "sl": "145.5", "tp": "160", "status": "CLOSED"},
+             "entry": 150.25, "sl": 145.5, "tp": 160.0, "status": SignalStatus.CLOSED},
         ]
         
         # Add sample data to the table
-        for row, data in enumerate(sample_data):
-            self.history_table.insertRow(row)
-            for col, key in enumerate(["timestamp", "trader", "symbol", "direction", "entry", "sl", "tp", "status"]):
-                item = QTableWidgetItem(data[key])
-                self.history_table.setItem(row, col, item)
+        keys = ["timestamp", "trader", "symbol", "direction", "entry", "sl", "tp", "status"]
+        self.history_model.append_rows([tuple(data[key] for key in keys) for data in sample_data])
         
         logger.info("Trade history refreshed")
     
@@ -684,12 +833,12 @@ class QtMainWindow(QMainWindow):
         """Clear the trade history"""
         reply = QMessageBox.question(
             self, "Confirm", "Are you sure you want to clear the trade history?", 
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, 
-            QMessageBox.StandardButton.No
+            _YES | _NO, _NO
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
-            self.history_table.setRowCount(0)
+        if reply == _YES:
+            self._pending_history.clear()
+            self.history_model.clear()
             logger.info("Trade history cleared")
     
     def _clear_logs(self):
@@ -705,43 +854,55 @@ class QtMainWindow(QMainWindow):
     
     def _on_signal_detected(self, signal):
         """Handle a detected trading signal"""
-        # Update signal display
-        self.signal_text.clear()
-        self.signal_text.append(f"Trader: {signal.get('trader', 'Unknown')}")
-        self.signal_text.append(f"Symbol: {signal.get('symbol', 'Unknown')}")
-        self.signal_text.append(f"Direction: {'LONG' if signal.get('is_long', True) else 'SHORT'}")
-        self.signal_text.append(f"Entry: {signal.get('entry_price', 0)}")
-        self.signal_text.append(f"Stop Loss: {signal.get('stop_loss', 0)}")
-        self.signal_text.append(f"Take Profit: {signal.get('take_profit', 0)}")
-        self.signal_text.append(f"Time: {signal.get('timestamp', 'N/A')}")
+        # Read each signal field once and share it between the display and history
+        timestamp = signal.get('timestamp', 'N/A')
+        trader = signal.get('trader', 'Unknown')
+        symbol = signal.get('symbol', 'Unknown')
+        direction = 'LONG' if signal.get('is_long', True) else 'SHORT'
+        entry = signal.get('entry_price', 0)
+        stop_loss = signal.get('stop_loss', 0)
+        take_profit = signal.get('take_profit', 0)
+        
+        # Update signal display in a single document update
+        self.signal_text.setPlainText(self.SIGNAL_TEMPLATE.format(
+            trader, symbol, direction, entry, stop_loss, take_profit, timestamp
+        ))
         
         # Add to history
-        self._add_signal_to_history(signal)
-    
-    def _add_signal_to_history(self, signal):
-        """Add a signal to the history table"""
-        row = self.history_table.rowCount()
-        self.history_table.insertRow(row)
-        
-        # Fill in the row
-        self.history_table.setItem(row, 0, QTableWidgetItem(signal.get('timestamp', 'N/A')))
-        self.history_table.setItem(row, 1, QTableWidgetItem(signal.get('trader', 'Unknown')))
-        self.history_table.setItem(row, 2, QTableWidgetItem(signal.get('symbol', 'Unknown')))
-        self.history_table.setItem(row, 3, QTableWidgetItem('LONG' if signal.get('is_long', True) else 'SHORT'))
-        self.history_table.setItem(row, 4, QTableWidgetItem(str(signal.get('entry_price', 0))))
-        self.history_table.setItem(row, 5, QTableWidgetItem(str(signal.get('stop_loss', 0))))
-        self.history_table.setItem(row, 6, QTableWidgetItem(str(signal.get('take_profit', 0))))
-        self.history_table.setItem(row, 7, QTableWidgetItem('PENDING'))
+        self._add_signal_to_history((
+            timestamp, trader, symbol, direction,
+            entry, stop_loss, take_profit, SignalStatus.PENDING
+        ))
+    
+    def _add_signal_to_history(self, row):
+        """
+        Queue a row for insertion into the history table
+        
+        Args:
+            row: Tuple with one value per history column
+        """
+        self._pending_history.append(row)
+        if not self._history_flush_timer.isActive():
+            self._history_flush_timer.start()
+    
+    def _flush_signal_history(self):
+        """Insert all queued rows into the history model in one batch"""
+        if not self._pending_history:
+            return
+        
+        rows = list(self._pending_history)
+        self._pending_history.clear()
+        
+        self.history_model.append_rows(rows)
     
     def closeEvent(self, event):
         """Handle window close event"""
         reply = QMessageBox.question(
             self, "Confirm Exit", "Are you sure you want to exit the application?", 
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, 
-            QMessageBox.StandardButton.No
+            _YES | _NO, _NO
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
+        if reply == _YES:
             # Stop threads
             if self.signal_processing_thread:
                 self.signal_processing_thread.stop()
@@ -757,20 +918,51 @@ class QtMainWindow(QMainWindow):
             event.ignore()
 
 class QTextEditLogger(logging.Handler):
-    """Custom logging handler that outputs to a QTextEdit"""
+    """
+    Custom logging handler that outputs to a QTextEdit
+    
+    Records are queued by emit() and appended in batches from a timer on the
+    GUI thread, so the handler can safely be called from worker threads.
+    """
+    
+    # Maximum number of log lines kept in the text edit
+    MAX_LOG_LINES = 5000
     
     def __init__(self, text_edit):
         super().__init__()
         self.text_edit = text_edit
+        self.text_edit.document().setMaximumBlockCount(self.MAX_LOG_LINES)
+        self._vbar = text_edit.verticalScrollBar()
+        
+        # Formatted records waiting to be appended (deque appends are thread-safe)
+        self._queue = deque()
+        
+        # Drain the queue every 100ms
+        self._flush_timer = QTimer()
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush)
+        self._flush_timer.start()
     
     def emit(self, record):
-        msg = self.format(record)
-        self.text_edit.append(msg)
-        # Scroll to the bottom to show the latest message
-        self.text_edit.verticalScrollBar().setValue(self.text_edit.verticalScrollBar().maximum())
+        self._queue.append(self.format(record))
+    
+    def _flush(self):
+        """Append all queued records to the text edit in one update"""
+        if not self._queue:
+            return
+        
+        batch = [self._queue.popleft() for _ in range(len(self._queue))]
+        self.text_edit.append("\n".join(batch))
+        self._scroll_to_bottom()
+    
+    def _scroll_to_bottom(self):
+        """Scroll to the bottom to show the latest message"""
+        self._vbar.setValue(self._vbar.maximum())
 
 def run_application(screen_capture, signal_parser, trading_client, config):
     """Run the PyQt6 application"""
+    from PyQt6.QtWidgets import QApplication
+    
     app = QApplication(sys.argv)
     
     # Set application style to fusion (looks better on macOS)
@@ -8,11 +8,33 @@ import os
 import sys
 import json
 import time
+import random
+import argparse
+
+# NumPy is only needed for batch (multi-scenario) simulations
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Numba is optional; when present the batch PnL loop is JIT-compiled
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
 
 class Config:
     """Simple configuration class for testing"""
     
+    __slots__ = ('trading_params', 'version')
+    
     def __init__(self):
+        # Incremented on every change so readers can tell when to reload
+        self.version = 0
         self.trading_params = {
             'amount_per_trade': 100.0,
             'max_position_size': 500.0,
@@ -37,6 +59,12 @@ class Config:
     def set_trading(self, key, value):
         """Set a value in the Trading section"""
         self.trading_params[key] = value
+        self.version += 1
+    
+    def update_trading(self, mapping):
+        """Set several values in the Trading section at once"""
+        self.trading_params.update(mapping)
+        self.version += 1
     
     def save(self):
         """Save configuration (print for testing)"""
@@ -45,185 +73,433 @@ class Config:
             print(f"  {key} = {value}")
         print("Configuration saved.\n")
 
+# Trading parameter schema: (key, type, default)
+_SCHEMA = [
+    ('amount_per_trade', float, 100.0),
+    ('max_position_size', float, 500.0),
+    ('stop_loss_percentage', float, 5.0),
+    ('take_profit_percentage', float, 15.0),
+    ('default_leverage', int, 5),
+    ('enable_stop_loss', bool, True),
+    ('enable_take_profit', bool, True),
+    ('use_signal_leverage', bool, True),
+    ('max_leverage', int, 20),
+    ('min_market_cap', int, 1000000),
+    ('enable_market_cap_filter', bool, True),
+    ('enable_auto_trading', bool, False),
+    ('auto_close_trades', bool, True),
+    ('max_simultaneous_trades', int, 5),
+]
+
+# String spellings accepted as True for boolean parameters
+_TRUE_STRS = frozenset(('true', '1', 'yes', 'on', 'y', 't', 'True', 'TRUE', 'Yes', 'YES'))
+
+# String spellings accepted as False when boolean input is validated
+_FALSE_STRS = frozenset(('false', '0', 'no', 'off', 'n', 'f', 'False', 'FALSE', 'No', 'NO'))
+
+def _parse_bool(value):
+    """Parse a boolean parameter that may be stored as a bool or a string"""
+    return value if isinstance(value, bool) else value in _TRUE_STRS
+
+def _validate_value(key, value, type_):
+    """
+    Convert a user-supplied parameter value to type_, rejecting values that don't fit
+    
+    Args:
+        key: Parameter name (used in error messages)
+        value: Value to convert
+        type_: Parameter type from _SCHEMA
+        
+    Returns:
+        Converted value
+        
+    Raises:
+        ValueError: If the value cannot be converted to type_
+    """
+    if type_ is bool:
+        if not (isinstance(value, bool) or
+                (isinstance(value, str) and (value in _TRUE_STRS or value in _FALSE_STRS))):
+            raise ValueError(f"{key} must be true or false, got {value!r}")
+    elif isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"{key} must be a number, got {value!r}")
+    elif type_ is int and isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"{key} must be a whole number, got {value!r}")
+    
+    try:
+        return _coerce(value, type_)
+    except ValueError:
+        raise ValueError(f"{key} must be a number, got {value!r}") from None
+
+def _coerce(value, type_):
+    """Convert a configuration value to type_, skipping values already of that type"""
+    if type_ is bool:
+        # Boolean values could also be strings
+        return _parse_bool(value)
+    if isinstance(value, type_):
+        return value
+    return type_(value)
+
 class TradingParams:
     """Mock trading parameters class (no GUI)"""
     
+    # Parameter display, rendered with a single format call
+    _DISPLAY_TEMPLATE = (
+        "\n=== Current Trading Parameters ===\n"
+        "Amount per Trade: ${p.amount_per_trade}\n"
+        "Maximum Position Size: ${p.max_position_size}\n"
+        "Stop Loss: {p.stop_loss_percentage}% {stop_loss}\n"
+        "Take Profit: {p.take_profit_percentage}% {take_profit}\n"
+        "Default Leverage: {p.default_leverage}x\n"
+        "Use Signal Leverage: {signal_leverage}\n"
+        "Maximum Leverage: {p.max_leverage}x\n"
+        "Minimum Market Cap: ${p.min_market_cap:,} {market_cap}\n"
+        "Auto Trading: {auto_trading}\n"
+        "Auto Close Trades: {auto_close}\n"
+        "Maximum Simultaneous Trades: {p.max_simultaneous_trades}\n"
+        "===================================\n\n"
+    )
+    
+    # Internal state that does not invalidate the display or load caches
+    _CACHE_ATTRS = frozenset(('_display_cache', '_loaded_version', '_last_input', '_sl_mul', '_tp_mul'))
+    
+    __slots__ = tuple(_CACHE_ATTRS) + ('config',) + tuple(key for key, _, _ in _SCHEMA)
+    
     def __init__(self, config):
         """Initialize with a configuration object"""
         self.config = config
         
-        # Trading parameters
-        self.amount_per_trade = 100.0
-        self.max_position_size = 500.0
-        self.stop_loss_percentage = 5.0
-        self.take_profit_percentage = 15.0
-        self.default_leverage = 5
-        self.enable_stop_loss = True
-        self.enable_take_profit = True
-        self.use_signal_leverage = True
-        self.max_leverage = 20
-        self.min_market_cap = 1000000
-        self.enable_market_cap_filter = True
-        self.enable_auto_trading = False
-        self.auto_close_trades = True
-        self.max_simultaneous_trades = 5
+        # Last (raw input, parsed value) accepted for each parameter
+        self._last_input = {}
         
-        # Load parameters from configuration
+        # Load parameters from configuration (schema defaults fill any gaps)
         self.load_params()
     
+    def __setattr__(self, name, value):
+        """Set an attribute and invalidate the cached display and load state"""
+        object.__setattr__(self, name, value)
+        if name not in self._CACHE_ATTRS:
+            object.__setattr__(self, '_display_cache', None)
+            object.__setattr__(self, '_loaded_version', None)
+            if name in ('stop_loss_percentage', 'take_profit_percentage'):
+                self._recompute_multipliers()
+    
+    def _recompute_multipliers(self):
+        """Precompute the stop loss and take profit price multipliers"""
+        self._sl_mul = 1 - self.stop_loss_percentage / 100
+        self._tp_mul = 1 + self.take_profit_percentage / 100
+    
     def load_params(self):
         """Load parameters from configuration"""
-        self.amount_per_trade = float(self.config.get_trading('amount_per_trade', 100.0))
-        self.max_position_size = float(self.config.get_trading('max_position_size', 500.0))
-        self.stop_loss_percentage = float(self.config.get_trading('stop_loss_percentage', 5.0))
-        self.take_profit_percentage = float(self.config.get_trading('take_profit_percentage', 15.0))
-        self.default_leverage = int(self.config.get_trading('default_leverage', 5))
-        
-        # Handle boolean values (which could be strings or booleans)
-        enable_stop_loss = self.config.get_trading('enable_stop_loss', True)
-        self.enable_stop_loss = enable_stop_loss if isinstance(enable_stop_loss, bool) else str(enable_stop_loss).lower() == 'true'
-        
-        enable_take_profit = self.config.get_trading('enable_take_profit', True)
-        self.enable_take_profit = enable_take_profit if isinstance(enable_take_profit, bool) else str(enable_take_profit).lower() == 'true'
+        # Skip the reload if neither the config nor the parameters changed since the last load
+        version = (id(self.config), self.config.version)
+        if self._loaded_version == version:
+            return
         
-        use_signal_leverage = self.config.get_trading('use_signal_leverage', True)
-        self.use_signal_leverage = use_signal_leverage if isinstance(use_signal_leverage, bool) else str(use_signal_leverage).lower() == 'true'
-        
-        self.max_leverage = int(self.config.get_trading('max_leverage', 20))
-        self.min_market_cap = int(self.config.get_trading('min_market_cap', 1000000))
-        
-        enable_market_cap_filter = self.config.get_trading('enable_market_cap_filter', True)
-        self.enable_market_cap_filter = enable_market_cap_filter if isinstance(enable_market_cap_filter, bool) else str(enable_market_cap_filter).lower() == 'true'
-        
-        enable_auto_trading = self.config.get_trading('enable_auto_trading', False)
-        self.enable_auto_trading = enable_auto_trading if isinstance(enable_auto_trading, bool) else str(enable_auto_trading).lower() == 'true'
+        # Assign every parameter directly, then invalidate and recompute once for the batch
+        for key, type_, default in _SCHEMA:
+            object.__setattr__(self, key, _coerce(self.config.get_trading(key, default), type_))
+        self._display_cache = None
+        self._recompute_multipliers()
+        self._loaded_version = version
+    
+    def parse_input(self, key, raw, type_):
+        """
+        Parse user input for a parameter, reusing the last result for identical input
         
-        auto_close_trades = self.config.get_trading('auto_close_trades', True)
-        self.auto_close_trades = auto_close_trades if isinstance(auto_close_trades, bool) else str(auto_close_trades).lower() == 'true'
+        Args:
+            key: Parameter name
+            raw: Text entered by the user
+            type_: Type to convert the input to (float or int)
+            
+        Returns:
+            Parsed value
+        """
+        last = self._last_input.get(key)
+        if last is not None and last[0] == raw:
+            return last[1]
         
-        self.max_simultaneous_trades = int(self.config.get_trading('max_simultaneous_trades', 5))
+        value = type_(raw)
+        self._last_input[key] = (raw, value)
+        return value
     
     def save_params(self):
         """Save parameters to configuration"""
-        self.config.set_trading('amount_per_trade', self.amount_per_trade)
-        self.config.set_trading('max_position_size', self.max_position_size)
-        self.config.set_trading('stop_loss_percentage', self.stop_loss_percentage)
-        self.config.set_trading('take_profit_percentage', self.take_profit_percentage)
-        self.config.set_trading('default_leverage', self.default_leverage)
-        self.config.set_trading('enable_stop_loss', 'true' if self.enable_stop_loss else 'false')
-        self.config.set_trading('enable_take_profit', 'true' if self.enable_take_profit else 'false')
-        self.config.set_trading('use_signal_leverage', 'true' if self.use_signal_leverage else 'false')
-        self.config.set_trading('max_leverage', self.max_leverage)
-        self.config.set_trading('min_market_cap', self.min_market_cap)
-        self.config.set_trading('enable_market_cap_filter', 'true' if self.enable_market_cap_filter else 'false')
-        self.config.set_trading('enable_auto_trading', 'true' if self.enable_auto_trading else 'false')
-        self.config.set_trading('auto_close_trades', 'true' if self.auto_close_trades else 'false')
-        self.config.set_trading('max_simultaneous_trades', self.max_simultaneous_trades)
+        # Values are stored in their native types, booleans included
+        self.config.update_trading({key: getattr(self, key) for key, _, _ in _SCHEMA})
         
         self.config.save()
     
     def display_params(self):
         """Display current parameters"""
-        print("\n=== Current Trading Parameters ===")
-        print(f"Amount per Trade: ${self.amount_per_trade}")
-        print(f"Maximum Position Size: ${self.max_position_size}")
-        print(f"Stop Loss: {self.stop_loss_percentage}% {'(Enabled)' if self.enable_stop_loss else '(Disabled)'}")
-        print(f"Take Profit: {self.take_profit_percentage}% {'(Enabled)' if self.enable_take_profit else '(Disabled)'}")
-        print(f"Default Leverage: {self.default_leverage}x")
-        print(f"Use Signal Leverage: {'Yes' if self.use_signal_leverage else 'No'}")
-        print(f"Maximum Leverage: {self.max_leverage}x")
-        print(f"Minimum Market Cap: ${self.min_market_cap:,} {'(Enabled)' if self.enable_market_cap_filter else '(Disabled)'}")
-        print(f"Auto Trading: {'Enabled' if self.enable_auto_trading else 'Disabled'}")
-        print(f"Auto Close Trades: {'Yes' if self.auto_close_trades else 'No'}")
-        print(f"Maximum Simultaneous Trades: {self.max_simultaneous_trades}")
-        print("===================================\n")
+        if self._display_cache is None:
+            self._display_cache = self._format_params()
+        sys.stdout.write(self._display_cache)
+    
+    def as_arrays(self):
+        """
+        Return the numeric parameters as NumPy scalars for batch simulations
+        
+        Returns:
+            dict: Float64 scalars keyed by 'sl_mul', 'tp_mul', 'position_size',
+                  'default_leverage', 'max_leverage' and 'min_market_cap'
+        """
+        return {
+            'sl_mul': np.float64(self._sl_mul),
+            'tp_mul': np.float64(self._tp_mul),
+            'position_size': np.float64(min(self.amount_per_trade, self.max_position_size)),
+            'default_leverage': np.float64(self.default_leverage),
+            'max_leverage': np.float64(self.max_leverage),
+            'min_market_cap': np.float64(self.min_market_cap),
+        }
+    
+    def _format_params(self):
+        """Format current parameters for display"""
+        return self._DISPLAY_TEMPLATE.format(
+            p=self,
+            stop_loss='(Enabled)' if self.enable_stop_loss else '(Disabled)',
+            take_profit='(Enabled)' if self.enable_take_profit else '(Disabled)',
+            signal_leverage='Yes' if self.use_signal_leverage else 'No',
+            market_cap='(Enabled)' if self.enable_market_cap_filter else '(Disabled)',
+            auto_trading='Enabled' if self.enable_auto_trading else 'Disabled',
+            auto_close='Yes' if self.auto_close_trades else 'No',
+        )
+
+def _write_lines(lines):
+    """Write lines to stdout with a single call"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+# Possible outcomes of a simulated trade
+_OUTCOMES = ('profit', 'loss', 'ongoing')
+
+# Sample trade signal used when simulate_trading is not given one
+_SAMPLE_SIGNAL = {
+    'symbol': "BTC/USDT",
+    'entry_price': 50000.0,
+    'leverage': 10,
+    'market_cap': 500000000,
+}
+
+# Seconds to pause while "price moves"; TRADER_CI=1 disables the pause for unattended runs
+_SIMULATION_DELAY = 0.0 if os.environ.get('TRADER_CI') == '1' else 1.0
 
-def simulate_trading(params):
+def simulate_trading(params, signal=None, delay=None):
     """
     Simulate a trading scenario using the parameters
     
     Args:
         params: TradingParams object with trading parameters
+        signal: Trade signal dict with 'symbol', 'entry_price', 'leverage' and
+                'market_cap' keys (defaults to a sample BTC/USDT signal)
+        delay: Seconds to wait before the outcome (defaults to _SIMULATION_DELAY)
     """
-    print("\n=== Trading Simulation ===")
-    print("Simulating a trading scenario with current parameters...")
+    if signal is None:
+        signal = _SAMPLE_SIGNAL
+    if delay is None:
+        delay = _SIMULATION_DELAY
+    
+    out = ["\n=== Trading Simulation ===",
+           "Simulating a trading scenario with current parameters..."]
     
     # Initial capital
     capital = 1000.0
-    print(f"Initial Capital: ${capital}")
+    out.append(f"Initial Capital: ${capital}")
     
-    # Simulate a trade signal
-    symbol = "BTC/USDT"
-    price = 50000.0
-    leverage = 10
-    market_cap = 500000000
+    # Trade signal
+    symbol = signal['symbol']
+    price = signal['entry_price']
+    leverage = signal['leverage']
+    market_cap = signal['market_cap']
     
-    print(f"\nReceived signal for {symbol} at ${price}")
-    print(f"Signal suggests {leverage}x leverage")
-    print(f"Market cap: ${market_cap:,}")
+    out.append(f"\nReceived signal for {symbol} at ${price}")
+    out.append(f"Signal suggests {leverage}x leverage")
+    out.append(f"Market cap: ${market_cap:,}")
     
     # Check market cap filter
     if params.enable_market_cap_filter and market_cap < params.min_market_cap:
-        print(f"Trade rejected: Market cap (${market_cap:,}) is below minimum threshold (${params.min_market_cap:,})")
+        out.append(f"Trade rejected: Market cap (${market_cap:,}) is below minimum threshold (${params.min_market_cap:,})")
+        _write_lines(out)
         return
     
     # Determine leverage
     actual_leverage = leverage if params.use_signal_leverage else params.default_leverage
     if actual_leverage > params.max_leverage:
         actual_leverage = params.max_leverage
-        print(f"Leverage capped at {actual_leverage}x (maximum allowed)")
+        out.append(f"Leverage capped at {actual_leverage}x (maximum allowed)")
     else:
-        print(f"Using leverage: {actual_leverage}x")
+        out.append(f"Using leverage: {actual_leverage}x")
     
     # Calculate position size
     position_size = params.amount_per_trade
     if position_size > params.max_position_size:
         position_size = params.max_position_size
-        print(f"Position size capped at ${position_size} (maximum allowed)")
+        out.append(f"Position size capped at ${position_size} (maximum allowed)")
     
     # Calculate contracts
     contracts = position_size / price * actual_leverage
-    print(f"Opening position: ${position_size} ({contracts:.8f} contracts)")
+    out.append(f"Opening position: ${position_size} ({contracts:.8f} contracts)")
     
     # Calculate stop loss and take profit
     if params.enable_stop_loss:
-        stop_loss_price = price * (1 - params.stop_loss_percentage / 100)
-        print(f"Stop Loss set at ${stop_loss_price:.2f} ({params.stop_loss_percentage}% from entry)")
+        stop_loss_price = price * params._sl_mul
+        out.append(f"Stop Loss set at ${stop_loss_price:.2f} ({params.stop_loss_percentage}% from entry)")
     
     if params.enable_take_profit:
-        take_profit_price = price * (1 + params.take_profit_percentage / 100)
-        print(f"Take Profit set at ${take_profit_price:.2f} ({params.take_profit_percentage}% from entry)")
+        take_profit_price = price * params._tp_mul
+        out.append(f"Take Profit set at ${take_profit_price:.2f} ({params.take_profit_percentage}% from entry)")
     
     # Simulate price movement
-    print("\nSimulating price movement...")
-    time.sleep(1)
+    out.append("\nSimulating price movement...")
+    _write_lines(out)
+    out = []
+    if delay:
+        time.sleep(delay)
     
     # Random outcome (simplified)
-    import random
-    outcome = random.choice(["profit", "loss", "ongoing"])
+    outcome = _OUTCOMES[random.randrange(len(_OUTCOMES))]
     
     if outcome == "profit":
-        new_price = price * (1 + params.take_profit_percentage / 100)
+        new_price = price * params._tp_mul
         profit = position_size * (params.take_profit_percentage / 100) * actual_leverage
-        print(f"Price moved to ${new_price:.2f}")
-        print(f"Take profit triggered! Profit: ${profit:.2f}")
+        out.append(f"Price moved to ${new_price:.2f}")
+        out.append(f"Take profit triggered! Profit: ${profit:.2f}")
         new_capital = capital + profit
     elif outcome == "loss":
-        new_price = price * (1 - params.stop_loss_percentage / 100)
+        new_price = price * params._sl_mul
         loss = position_size * (params.stop_loss_percentage / 100) * actual_leverage
-        print(f"Price moved to ${new_price:.2f}")
-        print(f"Stop loss triggered! Loss: ${loss:.2f}")
+        out.append(f"Price moved to ${new_price:.2f}")
+        out.append(f"Stop loss triggered! Loss: ${loss:.2f}")
         new_capital = capital - loss
     else:
         new_price = price * 1.02  # 2% movement
-        print(f"Price moved to ${new_price:.2f}")
-        print("Position still open, no trigger hit yet")
+        out.append(f"Price moved to ${new_price:.2f}")
+        out.append("Position still open, no trigger hit yet")
         unrealized_profit = position_size * 0.02 * actual_leverage
-        print(f"Unrealized profit: ${unrealized_profit:.2f}")
+        out.append(f"Unrealized profit: ${unrealized_profit:.2f}")
         new_capital = capital
     
-    print(f"\nCapital: ${new_capital:.2f}")
-    print("=========================\n")
+    out.append(f"\nCapital: ${new_capital:.2f}")
+    out.append("=========================\n")
+    _write_lines(out)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _simulate_batch(leverages, position_size, sl_pct, tp_pct, outcomes, capital):
+        """Compute the capital after each scenario's outcome (numeric core only)"""
+        new_capital = np.empty(leverages.shape[0])
+        for i in range(leverages.shape[0]):
+            if outcomes[i] == 0:  # profit
+                new_capital[i] = capital + position_size * (tp_pct / 100) * leverages[i]
+            elif outcomes[i] == 1:  # loss
+                new_capital[i] = capital - position_size * (sl_pct / 100) * leverages[i]
+            else:  # ongoing
+                new_capital[i] = capital
+        return new_capital
+
+# Field layout of the structured signal arrays accepted by simulate_trading_batch
+SIGNAL_DTYPE = [('entry_price', 'f8'), ('leverage', 'f8'), ('market_cap', 'f8')]
+
+def simulate_trading_batch(params, signals, outcomes=None, capital=1000.0):
+    """
+    Simulate many trades at once using vectorized NumPy operations
+    
+    Applies the same rules as simulate_trading to every signal without a
+    per-trade Python loop, for parameter sweeps and Monte Carlo runs.
+    
+    Args:
+        params: TradingParams object with trading parameters
+        signals: Structured array with SIGNAL_DTYPE fields, one row per signal
+        outcomes: Array of indexes into _OUTCOMES (random when None)
+        capital: Initial capital for every scenario
+        
+    Returns:
+        dict: Arrays keyed by 'accepted', 'leverage', 'contracts', 'stop_loss_price',
+              'take_profit_price' and 'new_capital'
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is required for batch simulations")
+    
+    signals = np.asarray(signals)
+    prices = signals['entry_price']
+    leverages = signals['leverage']
+    if outcomes is None:
+        outcomes = np.random.randint(0, len(_OUTCOMES), size=prices.shape)
+    else:
+        outcomes = np.asarray(outcomes)
+    p = params.as_arrays()
+    
+    # Check market cap filter
+    if params.enable_market_cap_filter:
+        accepted = signals['market_cap'] >= p['min_market_cap']
+    else:
+        accepted = np.ones(prices.shape, dtype=bool)
+    
+    # Determine leverage
+    if params.use_signal_leverage:
+        actual_leverage = np.minimum(leverages, p['max_leverage'])
+    else:
+        actual_leverage = np.full(prices.shape, min(p['default_leverage'], p['max_leverage']))
+    
+    # Calculate contracts (none for rejected signals)
+    position_size = p['position_size']
+    contracts = np.where(accepted, position_size / prices * actual_leverage, 0.0)
+    
+    # Calculate stop loss and take profit prices
+    stop_loss_price = prices * p['sl_mul']
+    take_profit_price = prices * p['tp_mul']
+    
+    # Apply the outcome of each scenario
+    if NUMBA_AVAILABLE:
+        new_capital = _simulate_batch(
+            actual_leverage, float(position_size),
+            float(params.stop_loss_percentage), float(params.take_profit_percentage),
+            outcomes.astype(np.int64), float(capital)
+        )
+    else:
+        profit = position_size * (params.take_profit_percentage / 100) * actual_leverage
+        loss = position_size * (params.stop_loss_percentage / 100) * actual_leverage
+        new_capital = np.full(prices.shape, capital)
+        new_capital += np.where(outcomes == 0, profit, 0.0)
+        new_capital -= np.where(outcomes == 1, loss, 0.0)
+    
+    # Rejected signals leave the capital untouched
+    new_capital = np.where(accepted, new_capital, capital)
+    
+    return {
+        'accepted': accepted,
+        'leverage': actual_leverage,
+        'contracts': contracts,
+        'stop_loss_price': stop_loss_price,
+        'take_profit_price': take_profit_price,
+        'new_capital': new_capital,
+    }
+
+def run_scenarios(params, count):
+    """
+    Run a batch of random trading scenarios and print a summary
+    
+    Args:
+        params: TradingParams object with trading parameters
+        count: Number of scenarios to simulate
+    """
+    if not NUMPY_AVAILABLE:
+        print("\nError: NumPy is required for batch simulations (pip install numpy)")
+        return
+    
+    signals = np.zeros(count, dtype=SIGNAL_DTYPE)
+    signals['entry_price'] = 50000.0
+    signals['leverage'] = 10.0
+    signals['market_cap'] = 500000000.0
+    result = simulate_trading_batch(params, signals)
+    capital = result['new_capital']
+    
+    _write_lines([
+        f"\n=== Batch Simulation ({count:,} scenarios) ===",
+        f"Rejected by Market Cap Filter: {count - int(result['accepted'].sum()):,}",
+        f"Average Capital: ${capital.mean():.2f}",
+        f"Minimum Capital: ${capital.min():.2f}",
+        f"Maximum Capital: ${capital.max():.2f}",
+        "=========================\n",
+    ])
 
 def modify_parameters(params):
     """
@@ -239,17 +515,17 @@ def modify_parameters(params):
         # Amount per trade
         input_value = input(f"Amount per Trade (current: ${params.amount_per_trade}): ")
         if input_value.strip():
-            params.amount_per_trade = float(input_value)
+            params.amount_per_trade = params.parse_input('amount_per_trade', input_value, float)
         
         # Max position size
         input_value = input(f"Maximum Position Size (current: ${params.max_position_size}): ")
         if input_value.strip():
-            params.max_position_size = float(input_value)
+            params.max_position_size = params.parse_input('max_position_size', input_value, float)
         
         # Stop loss percentage
         input_value = input(f"Stop Loss Percentage (current: {params.stop_loss_percentage}%): ")
         if input_value.strip():
-            params.stop_loss_percentage = float(input_value)
+            params.stop_loss_percentage = params.parse_input('stop_loss_percentage', input_value, float)
         
         # Enable stop loss
         input_value = input(f"Enable Stop Loss (current: {'Yes' if params.enable_stop_loss else 'No'}) [y/n]: ")
@@ -259,7 +535,7 @@ def modify_parameters(params):
         # Take profit percentage
         input_value = input(f"Take Profit Percentage (current: {params.take_profit_percentage}%): ")
         if input_value.strip():
-            params.take_profit_percentage = float(input_value)
+            params.take_profit_percentage = params.parse_input('take_profit_percentage', input_value, float)
         
         # Enable take profit
         input_value = input(f"Enable Take Profit (current: {'Yes' if params.enable_take_profit else 'No'}) [y/n]: ")
@@ -269,7 +545,7 @@ def modify_parameters(params):
         # Default leverage
         input_value = input(f"Default Leverage (current: {params.default_leverage}x): ")
         if input_value.strip():
-            params.default_leverage = int(input_value)
+            params.default_leverage = params.parse_input('default_leverage', input_value, int)
         
         # Use signal leverage
         input_value = input(f"Use Signal Leverage (current: {'Yes' if params.use_signal_leverage else 'No'}) [y/n]: ")
@@ -279,12 +555,12 @@ def modify_parameters(params):
         # Max leverage
         input_value = input(f"Maximum Leverage (current: {params.max_leverage}x): ")
         if input_value.strip():
-            params.max_leverage = int(input_value)
+            params.max_leverage = params.parse_input('max_leverage', input_value, int)
         
         # Min market cap
         input_value = input(f"Minimum Market Cap (current: ${params.min_market_cap:,}): ")
         if input_value.strip():
-            params.min_market_cap = int(input_value)
+            params.min_market_cap = params.parse_input('min_market_cap', input_value, int)
         
         # Enable market cap filter
         input_value = input(f"Enable Market Cap Filter (current: {'Yes' if params.enable_market_cap_filter else 'No'}) [y/n]: ")
@@ -304,7 +580,7 @@ def modify_parameters(params):
         # Max simultaneous trades
         input_value = input(f"Maximum Simultaneous Trades (current: {params.max_simultaneous_trades}): ")
         if input_value.strip():
-            params.max_simultaneous_trades = int(input_value)
+            params.max_simultaneous_trades = params.parse_input('max_simultaneous_trades', input_value, int)
         
         # Save parameters
         print("\nSaving parameters...")
@@ -314,8 +590,76 @@ def modify_parameters(params):
         print(f"\nError: {e}")
         print("Please enter valid values. No changes were saved.")
 
-def main():
+def modify_parameters_from_json(params, path):
+    """
+    Modify parameters from a JSON file instead of the interactive prompts
+    
+    Args:
+        params: TradingParams object to modify
+        path: Path to a JSON object mapping parameter names to new values
+        
+    Returns:
+        bool: True if the parameters were applied and saved
+    """
+    try:
+        with open(path) as f:
+            patch = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"\nError: Could not read parameters from {path}: {e}")
+        return False
+    
+    if not isinstance(patch, dict):
+        print(f"\nError: {path} must contain a JSON object mapping parameter names to values")
+        print("No changes were saved.")
+        return False
+    
+    types = {key: type_ for key, type_, _ in _SCHEMA}
+    unknown_keys = sorted(set(patch) - set(types))
+    if unknown_keys:
+        print(f"\nError: Unknown parameters: {', '.join(unknown_keys)}")
+        print("No changes were saved.")
+        return False
+    
+    # Convert every value before touching params, so a bad value leaves them unchanged
+    try:
+        values = {key: _validate_value(key, value, types[key]) for key, value in patch.items()}
+    except ValueError as e:
+        print(f"\nError: {e}")
+        print("No changes were saved.")
+        return False
+    
+    for key, value in values.items():
+        setattr(params, key, value)
+    
+    print(f"\nApplying {len(patch)} parameter(s) from {path}...")
+    params.save_params()
+    return True
+
+def _exit_menu(params):
+    """Leave the interactive menu"""
+    print("\nExiting program. Goodbye!")
+    return False
+
+# Interactive menu handlers keyed by choice; a handler returns False to exit the menu
+_MENU_DISPATCH = {
+    '1': TradingParams.display_params,
+    '2': modify_parameters,
+    '3': simulate_trading,
+    '4': TradingParams.save_params,
+    '5': _exit_menu,
+}
+
+def main(argv=None):
     """Main function"""
+    parser = argparse.ArgumentParser(description="Headless test for the enhanced trading parameters")
+    parser.add_argument('--params-json', metavar='PATH',
+                        help="apply parameter changes from a JSON file and exit (no interactive menu)")
+    parser.add_argument('--scenarios', type=int, metavar='N',
+                        help="simulate N random trades in one batch (requires NumPy) and exit")
+    args = parser.parse_args(argv)
+    if args.scenarios is not None and args.scenarios < 1:
+        parser.error(f"--scenarios must be at least 1, got {args.scenarios}")
+    
     print("===================================================")
     print("    DISCORD TRADING SIGNAL SCRAPER - PARAMETERS    ")
     print("===================================================")
@@ -326,6 +670,16 @@ def main():
     config = Config()
     params = TradingParams(config)
     
+    # Batch mode: apply the JSON patch and/or run scenarios, skipping the interactive menu
+    if args.params_json or args.scenarios is not None:
+        if args.params_json:
+            if not modify_parameters_from_json(params, args.params_json):
+                return
+            params.display_params()
+        if args.scenarios is not None:
+            run_scenarios(params, args.scenarios)
+        return
+    
     while True:
         print("\nMenu:")
         print("1. Display Current Parameters")
@@ -336,19 +690,11 @@ def main():
         
         choice = input("\nEnter your choice (1-5): ")
         
-        if choice == '1':
-            params.display_params()
-        elif choice == '2':
-            modify_parameters(params)
-        elif choice == '3':
-            simulate_trading(params)
-        elif choice == '4':
-            params.save_params()
-        elif choice == '5':
-            print("\nExiting program. Goodbye!")
-            break
-        else:
+        handler = _MENU_DISPATCH.get(choice)
+        if handler is None:
             print("\nInvalid choice. Please try again.")
+        elif handler(params) is False:
+            break
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
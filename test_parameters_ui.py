@@ -6,64 +6,173 @@ This script demonstrates the parameters UI without requiring the full system
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import tkinter.font as tkfont
 import os
 import sys
 import logging
+import functools
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler()
-    ]
+logger = logging.getLogger(__name__)
+
+# Precomputed string forms for the values saved most often
+_BOOL_STR = {True: 'true', False: 'false'}
+_SMALL_INT_STRS = tuple(str(i) for i in range(256))
+
+def _int_str(value):
+    """Convert an integer to a string, using the lookup table for small values"""
+    return _SMALL_INT_STRS[value] if 0 <= value < 256 else str(value)
+
+def _format_value(value):
+    """Serialize a configuration value to its config-file string form"""
+    if isinstance(value, bool):
+        return _BOOL_STR[value]
+    if isinstance(value, int):
+        return _int_str(value)
+    return str(value)
+
+# Case-folded string spellings read as True for boolean values
+_TRUTHY = frozenset(('true', '1', 'yes', 'on'))
+
+@functools.lru_cache(maxsize=128)
+def _truthy(text):
+    """Return whether a stored string spells True (cached, the same few strings recur)"""
+    return text.casefold() in _TRUTHY
+
+def _parse_bool(value):
+    """Read a boolean configuration value, which may also be a string"""
+    return value if isinstance(value, bool) else _truthy(str(value))
+
+# Trading parameter sections shown in the UI: (section title, rows), where each row is
+# (label, config key, type, default, hint, entry width); bool rows become checkbuttons
+_PARAM_SECTIONS = (
+    ("Position Size Settings", (
+        ("Amount per Trade ($):", 'amount_per_trade', float, 100.0, "USD value to invest in each trade signal", 10),
+        ("Max Position Size ($):", 'max_position_size', float, 500.0, "Maximum USD value per position", 10),
+    )),
+    ("Risk Management Settings", (
+        ("Stop Loss (%):", 'stop_loss_percentage', float, 5.0, "Percentage loss at which position will close", 10),
+        ("Take Profit (%):", 'take_profit_percentage', float, 15.0, "Percentage gain at which position will close", 10),
+        ("Enable Stop Loss", 'enable_stop_loss', bool, True, None, None),
+        ("Enable Take Profit", 'enable_take_profit', bool, True, None, None),
+    )),
+    ("Leverage Settings", (
+        ("Default Leverage:", 'default_leverage', int, 5, "Default leverage multiplier for trades", 10),
+        ("Use Leverage from Signal (when available)", 'use_signal_leverage', bool, True, None, None),
+        ("Maximum Leverage:", 'max_leverage', int, 20, "Maximum allowed leverage (caps signal leverage)", 10),
+    )),
+    ("Market Filtering Settings", (
+        ("Minimum Market Cap ($):", 'min_market_cap', int, 1000000, "Don't trade coins with market cap below this value", 15),
+        ("Enable Market Cap Filter", 'enable_market_cap_filter', bool, True, None, None),
+    )),
+    ("Auto Trading Settings", (
+        ("Enable Automatic Trading (trades will execute without confirmation)", 'enable_auto_trading', bool, False, None, None),
+        ("Automatically Close Trades at Stop Loss/Take Profit", 'auto_close_trades', bool, True, None, None),
+        ("Max Simultaneous Trades:", 'max_simultaneous_trades', int, 5, "Maximum number of open positions", 10),
+    )),
 )
 
-logger = logging.getLogger(__name__)
+# Spacing of the parameter rows drawn on each section canvas (pixels); the
+# column positions and row height are measured from the font and widgets
+_LABEL_X = 5
+_COLUMN_GAP = 12
+_ROW_PADDING = 8
 
 class Config:
     """Simple configuration class for testing"""
     
+    __slots__ = ('config', '_trading', '_typed')
+    
     def __init__(self):
+        # Values are kept in their native types; they are only stringified on save
         self.config = {
             'Trading': {
-                'amount_per_trade': '100.0',
-                'max_position_size': '500.0',
-                'stop_loss_percentage': '5.0',
-                'take_profit_percentage': '15.0',
-                'default_leverage': '5',
-                'enable_stop_loss': 'true',
-                'enable_take_profit': 'true',
-                'use_signal_leverage': 'true',
-                'max_leverage': '20',
-                'min_market_cap': '1000000',
-                'enable_market_cap_filter': 'true',
-                'enable_auto_trading': 'false',
-                'auto_close_trades': 'true',
-                'max_simultaneous_trades': '5'
+                'amount_per_trade': 100.0,
+                'max_position_size': 500.0,
+                'stop_loss_percentage': 5.0,
+                'take_profit_percentage': 15.0,
+                'default_leverage': 5,
+                'enable_stop_loss': True,
+                'enable_take_profit': True,
+                'use_signal_leverage': True,
+                'max_leverage': 20,
+                'min_market_cap': 1000000,
+                'enable_market_cap_filter': True,
+                'enable_auto_trading': False,
+                'auto_close_trades': True,
+                'max_simultaneous_trades': 5
             }
         }
+        # The Trading section always exists, so keep a direct reference to it
+        self._trading = self.config['Trading']
+        # Converted Trading values keyed by (key, type), cleared whenever a value changes
+        self._typed = {}
     
     def get_trading(self, key, default=None):
         """Get a value from the Trading section"""
-        if 'Trading' in self.config and key in self.config['Trading']:
-            return self.config['Trading'][key]
-        return default
+        return self._trading.get(key, default)
+    
+    def _get_trading_typed(self, key, default, type_, convert):
+        """Get a Trading value converted with convert, caching the result per key and type"""
+        try:
+            return self._typed[key, type_]
+        except KeyError:
+            pass
+        if key not in self._trading:
+            return convert(default)
+        value = self._typed[key, type_] = convert(self._trading[key])
+        return value
+    
+    def get_trading_float(self, key, default=0.0):
+        """Get a Trading value as a float"""
+        return self._get_trading_typed(key, default, float, float)
+    
+    def get_trading_int(self, key, default=0):
+        """Get a Trading value as an int"""
+        return self._get_trading_typed(key, default, int, int)
+    
+    def get_trading_bool(self, key, default=False):
+        """Get a Trading value as a bool"""
+        return self._get_trading_typed(key, default, bool, _parse_bool)
     
     def set_trading(self, key, value):
         """Set a value in the Trading section"""
-        if 'Trading' not in self.config:
-            self.config['Trading'] = {}
-        self.config['Trading'][key] = value
-        print(f"Set {key} = {value}")
+        self._trading[key] = value
+        self._typed.clear()
+        print(f"Set {key} = {_format_value(value)}")
+    
+    def update_trading(self, values):
+        """Set several values in the Trading section at once"""
+        self._trading.update(values)
+        self._typed.clear()
         
     def save(self):
         """Save configuration (print for testing)"""
-        print("Configuration saved:")
+        # Build the whole listing first and write it with a single call
+        lines = ["Configuration saved:"]
         for section, values in self.config.items():
-            print(f"[{section}]")
-            for key, value in values.items():
-                print(f"{key} = {value}")
+            lines.append(f"[{section}]")
+            lines.extend(f"{key} = {_format_value(value)}" for key, value in values.items())
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+# Typed Config accessor for each parameter type
+_VALUE_READERS = {
+    float: Config.get_trading_float,
+    int: Config.get_trading_int,
+    bool: Config.get_trading_bool,
+}
+
+def _parse_int(text):
+    """Parse integer entry text, accepting a decimal point like tk.IntVar does"""
+    try:
+        return int(text)
+    except ValueError:
+        return int(float(text))
+
+# Parser for the text of each numeric entry type
+_ENTRY_PARSERS = {float: float, int: _parse_int}
+
+# Type of every parameter, by config key
+_PARAM_TYPES = {key: type_ for _, rows in _PARAM_SECTIONS for _, key, type_, _, _, _ in rows}
 
 class TradingParametersTest:
     """Test class for trading parameters UI"""
@@ -74,11 +183,21 @@ class TradingParametersTest:
         
     def run(self):
         """Start the UI test"""
+        # Read and convert the parameter values once before building the widgets
+        self._values = self._load_values()
+        
         # Create the main window
         self.root = tk.Tk()
         self.root.title("Trading Parameters Test")
         self.root.geometry("850x650")
         
+        # Shared styles for the parameter rows, configured once for every widget
+        style = ttk.Style(self.root)
+        style.configure('Param.TEntry', padding=2)
+        
+        # Keep the window hidden while widgets are built so Tk skips intermediate redraws
+        self.root.withdraw()
+        
         # Create the main frame
         main_frame = ttk.Frame(self.root, padding=10)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -86,9 +205,22 @@ class TradingParametersTest:
         # Create the trading parameters tab
         self._create_trading_params_tab(main_frame)
         
+        self.root.deiconify()
+        
         # Start the main loop
         self.root.mainloop()
     
+    def _load_values(self):
+        """
+        Read every trading parameter from the configuration, converted to its type
+        
+        Returns:
+            dict: Parameter values keyed by config key, in table order
+        """
+        config = self.config
+        return {key: _VALUE_READERS[type_](config, key, default)
+                for _, rows in _PARAM_SECTIONS for _, key, type_, default, _, _ in rows}
+    
     def _create_trading_params_tab(self, parent):
         """
         Create the trading parameters tab with enhanced options
@@ -96,164 +228,128 @@ class TradingParametersTest:
         Args:
             parent: Parent widget
         """
-        # Create main container with scrollbar
-        container = ttk.Frame(parent)
-        container.pack(fill=tk.BOTH, expand=True)
-        
-        # Create canvas for scrolling
-        canvas = tk.Canvas(container)
-        scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-        scroll_frame = ttk.Frame(canvas)
-        
-        scroll_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # One notebook tab per settings section; a tab's widgets are built the first
+        # time it is selected
+        notebook = ttk.Notebook(parent)
+        notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Position Size Settings
-        position_frame = ttk.LabelFrame(scroll_frame, text="Position Size Settings", padding=10)
-        position_frame.pack(fill=tk.X, padx=5, pady=5)
+        # Parameter values (self._values) live in a plain dict; widgets only write to it on edit
+        self._entries = {}
+        self._checks = {}
+        self._builders = {}
+        for section, rows in _PARAM_SECTIONS:
+            frame = ttk.Frame(notebook, padding=10)
+            notebook.add(frame, text=section.replace(" Settings", ""))
+            self._builders[str(frame)] = (frame, rows)
         
-        # Amount per trade
-        ttk.Label(position_frame, text="Amount per Trade ($):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.amount_per_trade_var = tk.DoubleVar(value=float(self.config.get_trading('amount_per_trade', 100.0)))
-        amount_entry = ttk.Entry(position_frame, textvariable=self.amount_per_trade_var, width=10)
-        amount_entry.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(position_frame, text="USD value to invest in each trade signal").grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_change)
+        self._notebook = notebook
+        self._on_tab_change()
         
-        # Max position size
-        ttk.Label(position_frame, text="Max Position Size ($):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.max_position_var = tk.DoubleVar(value=float(self.config.get_trading('max_position_size', 500.0)))
-        max_position_entry = ttk.Entry(position_frame, textvariable=self.max_position_var, width=10)
-        max_position_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(position_frame, text="Maximum USD value per position").grid(row=1, column=2, sticky=tk.W, padx=5, pady=5)
-        
-        # Risk Management Settings
-        risk_frame = ttk.LabelFrame(scroll_frame, text="Risk Management Settings", padding=10)
-        risk_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        # Stop Loss
-        ttk.Label(risk_frame, text="Stop Loss (%):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.stop_loss_pct_var = tk.DoubleVar(value=float(self.config.get_trading('stop_loss_percentage', 5.0)))
-        stop_loss_entry = ttk.Entry(risk_frame, textvariable=self.stop_loss_pct_var, width=10)
-        stop_loss_entry.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(risk_frame, text="Percentage loss at which position will close").grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
-        
-        # Take Profit
-        ttk.Label(risk_frame, text="Take Profit (%):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.take_profit_pct_var = tk.DoubleVar(value=float(self.config.get_trading('take_profit_percentage', 15.0)))
-        take_profit_entry = ttk.Entry(risk_frame, textvariable=self.take_profit_pct_var, width=10)
-        take_profit_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(risk_frame, text="Percentage gain at which position will close").grid(row=1, column=2, sticky=tk.W, padx=5, pady=5)
-        
-        # Enable Stop Loss
-        self.stop_loss_var = tk.BooleanVar(value=self.config.get_trading('enable_stop_loss', 'true').lower() == 'true')
-        stop_loss_check = ttk.Checkbutton(risk_frame, text="Enable Stop Loss", variable=self.stop_loss_var)
-        stop_loss_check.grid(row=2, column=0, columnspan=3, sticky=tk.W, padx=5, pady=5)
-        
-        # Enable Take Profit
-        self.take_profit_var = tk.BooleanVar(value=self.config.get_trading('enable_take_profit', 'true').lower() == 'true')
-        take_profit_check = ttk.Checkbutton(risk_frame, text="Enable Take Profit", variable=self.take_profit_var)
-        take_profit_check.grid(row=3, column=0, columnspan=3, sticky=tk.W, padx=5, pady=5)
-        
-        # Leverage Settings
-        leverage_frame = ttk.LabelFrame(scroll_frame, text="Leverage Settings", padding=10)
-        leverage_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        # Default Leverage
-        ttk.Label(leverage_frame, text="Default Leverage:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.leverage_var = tk.IntVar(value=int(self.config.get_trading('default_leverage', 5)))
-        leverage_entry = ttk.Entry(leverage_frame, textvariable=self.leverage_var, width=10)
-        leverage_entry.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(leverage_frame, text="Default leverage multiplier for trades").grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
-        
-        # Use Signal Leverage
-        self.use_signal_leverage_var = tk.BooleanVar(value=self.config.get_trading('use_signal_leverage', 'true').lower() == 'true')
-        signal_leverage_check = ttk.Checkbutton(leverage_frame, text="Use Leverage from Signal (when available)", variable=self.use_signal_leverage_var)
-        signal_leverage_check.grid(row=1, column=0, columnspan=3, sticky=tk.W, padx=5, pady=5)
-        
-        # Max Leverage
-        ttk.Label(leverage_frame, text="Maximum Leverage:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        self.max_leverage_var = tk.IntVar(value=int(self.config.get_trading('max_leverage', 20)))
-        max_leverage_entry = ttk.Entry(leverage_frame, textvariable=self.max_leverage_var, width=10)
-        max_leverage_entry.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(leverage_frame, text="Maximum allowed leverage (caps signal leverage)").grid(row=2, column=2, sticky=tk.W, padx=5, pady=5)
-        
-        # Filtering Settings
-        filter_frame = ttk.LabelFrame(scroll_frame, text="Market Filtering Settings", padding=10)
-        filter_frame.pack(fill=tk.X, padx=5, pady=5)
+        # Save button
+        save_button = ttk.Button(parent, text="Save Trading Parameters", command=self._save_trading_params)
+        save_button.pack(pady=10)
+    
+    def _on_tab_change(self, event=None):
+        """Build the selected settings tab if it has not been built yet"""
+        builder = self._builders.pop(self._notebook.select(), None)
+        if builder is not None:
+            self._build_section(*builder)
+    
+    def _build_section(self, frame, rows):
+        """
+        Build the parameter rows of one settings section
         
-        # Minimum Market Cap
-        ttk.Label(filter_frame, text="Minimum Market Cap ($):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.min_market_cap_var = tk.IntVar(value=int(self.config.get_trading('min_market_cap', 1000000)))
-        market_cap_entry = ttk.Entry(filter_frame, textvariable=self.min_market_cap_var, width=15)
-        market_cap_entry.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(filter_frame, text="Don't trade coins with market cap below this value").grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
+        Static text (labels and hints) is drawn on a single canvas; only the
+        editable fields are widgets. Column positions come from the widest
+        label and entry in the section, and the row height from the font's
+        line spacing, so the layout follows the platform font.
         
-        # Enable Market Cap Filter
-        self.enable_market_cap_filter_var = tk.BooleanVar(value=self.config.get_trading('enable_market_cap_filter', 'true').lower() == 'true')
-        market_cap_check = ttk.Checkbutton(filter_frame, text="Enable Market Cap Filter", variable=self.enable_market_cap_filter_var)
-        market_cap_check.grid(row=1, column=0, columnspan=3, sticky=tk.W, padx=5, pady=5)
+        Args:
+            frame: Notebook tab frame for the section
+            rows: Parameter rows from _PARAM_SECTIONS
+        """
+        # Match the themed widgets: canvas text otherwise defaults to black, even on dark themes
+        style = ttk.Style(self.root)
+        background = style.lookup('TFrame', 'background')
+        foreground = style.lookup('TLabel', 'foreground') or 'black'
+        panel = tk.Canvas(frame, background=background, highlightthickness=0)
+        panel.pack(fill=tk.X)
         
-        # Auto Trading Settings
-        auto_frame = ttk.LabelFrame(scroll_frame, text="Auto Trading Settings", padding=10)
-        auto_frame.pack(fill=tk.X, padx=5, pady=5)
+        # Create the widgets first so their requested sizes can be measured
+        check_cls, add_entry = ttk.Checkbutton, self._param_entry
+        widgets = []
+        for text, key, type_, _, hint, width in rows:
+            if type_ is bool:
+                check = check_cls(panel, text=text, command=lambda key=key: self._on_check(key))
+                check.state(['!alternate', 'selected' if self._values[key] else '!selected'])
+                self._checks[key] = check
+                widgets.append(check)
+            else:
+                widgets.append(add_entry(panel, key, width))
         
-        # Enable Auto Trading
-        self.enable_auto_trading_var = tk.BooleanVar(value=self.config.get_trading('enable_auto_trading', 'false').lower() == 'true')
-        auto_trading_check = ttk.Checkbutton(auto_frame, text="Enable Automatic Trading (trades will execute without confirmation)", 
-                                          variable=self.enable_auto_trading_var)
-        auto_trading_check.grid(row=0, column=0, columnspan=3, sticky=tk.W, padx=5, pady=5)
+        font = tkfont.nametofont('TkDefaultFont')
+        entry_rows = [(text, hint, widget) for (text, _, type_, _, hint, _), widget
+                      in zip(rows, widgets) if type_ is not bool]
+        entry_x = _LABEL_X + max((font.measure(text) for text, _, _ in entry_rows), default=0) + _COLUMN_GAP
+        hint_x = entry_x + max((entry.winfo_reqwidth() for _, _, entry in entry_rows), default=0) + _COLUMN_GAP
+        row_height = max([font.metrics('linespace')] + [w.winfo_reqheight() for w in widgets]) + _ROW_PADDING
         
-        # Auto Close Trades
-        self.auto_close_trades_var = tk.BooleanVar(value=self.config.get_trading('auto_close_trades', 'true').lower() == 'true')
-        auto_close_check = ttk.Checkbutton(auto_frame, text="Automatically Close Trades at Stop Loss/Take Profit", 
-                                         variable=self.auto_close_trades_var)
-        auto_close_check.grid(row=1, column=0, columnspan=3, sticky=tk.W, padx=5, pady=5)
+        for row, ((text, _, type_, _, hint, _), widget) in enumerate(zip(rows, widgets)):
+            y = row * row_height + row_height // 2
+            if type_ is bool:
+                panel.create_window(_LABEL_X, y, anchor='w', window=widget)
+            else:
+                panel.create_text(_LABEL_X, y, text=text, anchor='w', fill=foreground)
+                panel.create_window(entry_x, y, anchor='w', window=widget)
+                panel.create_text(hint_x, y, text=hint, anchor='w', fill=foreground)
         
-        # Max Simultaneous Trades
-        ttk.Label(auto_frame, text="Max Simultaneous Trades:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        self.max_trades_var = tk.IntVar(value=int(self.config.get_trading('max_simultaneous_trades', 5)))
-        max_trades_entry = ttk.Entry(auto_frame, textvariable=self.max_trades_var, width=10)
-        max_trades_entry.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(auto_frame, text="Maximum number of open positions").grid(row=2, column=2, sticky=tk.W, padx=5, pady=5)
+        width = max([hint_x + font.measure(hint) for _, hint, _ in entry_rows]
+                    + [_LABEL_X + w.winfo_reqwidth() for w in widgets]) + _LABEL_X
+        panel.configure(width=width, height=len(rows) * row_height)
+    
+    def _param_entry(self, panel, key, width=10):
+        """
+        Create the entry for a parameter row on a section canvas
         
-        # Save button
-        save_button = ttk.Button(scroll_frame, text="Save Trading Parameters", command=self._save_trading_params)
-        save_button.pack(pady=10)
+        Args:
+            panel: Section canvas the entry is placed on
+            key: Config key of the parameter
+            width: Entry width in characters
+            
+        Returns:
+            ttk.Entry: The entry holding the parameter's current value
+        """
+        entry = ttk.Entry(panel, width=width, style='Param.TEntry')
+        entry.insert(0, str(self._values[key]))
+        entry.bind('<FocusOut>', lambda e, key=key: self._on_entry_focus_out(key))
+        self._entries[key] = entry
+        return entry
+    
+    def _sync_entry(self, key):
+        """Parse an entry's text into the parameter values (raises ValueError if invalid)"""
+        self._values[key] = _ENTRY_PARSERS[_PARAM_TYPES[key]](self._entries[key].get())
+    
+    def _on_entry_focus_out(self, key):
+        """Store an edited entry value when the entry loses focus"""
+        try:
+            self._sync_entry(key)
+        except ValueError:
+            # Left as typed; reported when the parameters are saved
+            pass
+    
+    def _on_check(self, key):
+        """Store a checkbutton's new state in the parameter values"""
+        self._values[key] = self._checks[key].instate(['selected'])
     
     def _save_trading_params(self):
         """Save trading parameters to the configuration"""
         try:
-            # Position size settings
-            self.config.set_trading('amount_per_trade', str(self.amount_per_trade_var.get()))
-            self.config.set_trading('max_position_size', str(self.max_position_var.get()))
-            
-            # Risk management settings
-            self.config.set_trading('stop_loss_percentage', str(self.stop_loss_pct_var.get()))
-            self.config.set_trading('take_profit_percentage', str(self.take_profit_pct_var.get()))
-            self.config.set_trading('enable_stop_loss', str(self.stop_loss_var.get()).lower())
-            self.config.set_trading('enable_take_profit', str(self.take_profit_var.get()).lower())
-            
-            # Leverage settings
-            self.config.set_trading('default_leverage', str(self.leverage_var.get()))
-            self.config.set_trading('use_signal_leverage', str(self.use_signal_leverage_var.get()).lower())
-            self.config.set_trading('max_leverage', str(self.max_leverage_var.get()))
-            
-            # Filtering settings
-            self.config.set_trading('min_market_cap', str(self.min_market_cap_var.get()))
-            self.config.set_trading('enable_market_cap_filter', str(self.enable_market_cap_filter_var.get()).lower())
+            # Pick up edits in an entry that still has focus
+            for key in self._entries:
+                self._sync_entry(key)
             
-            # Auto trading settings
-            self.config.set_trading('enable_auto_trading', str(self.enable_auto_trading_var.get()).lower())
-            self.config.set_trading('auto_close_trades', str(self.auto_close_trades_var.get()).lower())
-            self.config.set_trading('max_simultaneous_trades', str(self.max_trades_var.get()))
+            self.config.update_trading(self._values)
             
             # Save configuration
             self.config.save()
@@ -266,6 +362,14 @@ class TradingParametersTest:
 
 # Run the test if executed directly
 if __name__ == "__main__":
+    # Configure logging (only when run as a script, not when imported)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler()
+        ]
+    )
     print("Starting Trading Parameters Test UI...")
     app = TradingParametersTest()
     app.run()
\ No newline at end of file
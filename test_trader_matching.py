@@ -4,40 +4,96 @@ Test script for trader name matching functionality
 This script tests the flexible trader name matching we've implemented
 """
 
-import re
 import logging
+import functools
+
+# NumPy is only needed for the batch (vectorized) matching check
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
-def test_trader_matching(trader, test_text):
-    """Test if a trader would match in a text with flexible matching"""
-    # Normalize trader names for comparison
-    normalized_trader = re.sub(r'[^a-zA-Z0-9]', '', trader.lower())
-    normalized_text = test_text.lower()
+# Every ASCII byte that is not a letter or digit, deleted by _normalize_trader
+_NON_ALNUM_BYTES = bytes(b for b in range(128) if not chr(b).isalnum())
+
+@functools.lru_cache(maxsize=None)
+def _normalize_trader(trader):
+    """Normalize a trader name to lowercase letters and digits (cached, traders repeat across messages)"""
+    # Drop non-ASCII characters, then delete the remaining non-alphanumerics with a translate table
+    return trader.lower().encode('ascii', 'ignore').translate(None, _NON_ALNUM_BYTES).decode('ascii')
+
+@functools.lru_cache(maxsize=None)
+def _trader_variations(trader):
+    """
+    Build the name variations to look for when matching a trader (cached per trader)
     
-    # Create variations to test
-    variations = [
+    Returns:
+        tuple: (variation, lowercased variation) pairs in match order
+    """
+    normalized_trader = _normalize_trader(trader)
+    variations = (
         trader,                                  # Original format (e.g., @Bryce)
         trader.replace('@', '@-'),              # With hyphen (e.g., @-Bryce)
         trader.replace('@-', '@'),              # Without hyphen (e.g., @Bryce)
         normalized_trader,                       # Normalized (e.g., bryce)
         '@' + normalized_trader.lstrip('@'),     # Add @ if missing
-    ]
+    )
+    return tuple((var, var.lower()) for var in variations)
+
+def test_trader_matching(trader, test_text):
+    """Test if a trader would match in a text with flexible matching"""
+    normalized_text = test_text.lower()
+    
+    # Variations to test, built once per trader
+    variations = _trader_variations(trader)
     
-    logger.info(f"Testing trader '{trader}' against text: '{test_text}'")
-    logger.info(f"Variations being checked: {', '.join(variations)}")
+    # Diagnostics: compiled out under python -O, and only built when INFO output is enabled
+    if __debug__:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Testing trader '%s' against text: '%s'", trader, test_text)
+            logger.info("Variations being checked: %s", ', '.join(var for var, _ in variations))
     
-    # Check if any variation is in the text
-    for var in variations:
-        if var.lower() in normalized_text:
-            logger.info(f"✅ MATCH FOUND: '{var}' found in text")
-            return True
+    # Find the first variation in the text (stops at the first hit)
+    match = next((var for var, lowered in variations if lowered in normalized_text), None)
+    if match is not None:
+        logger.info("✅ MATCH FOUND: '%s' found in text", match)
+        return True
     
     logger.info("❌ NO MATCH: None of the variations found in text")
     return False
 
+def match_traders_batch(traders, texts):
+    """
+    Match many (trader, text) pairs at once using vectorized NumPy string operations
+    
+    Applies the same variation rules as test_trader_matching, one variation
+    at a time across every pair, without a per-pair Python loop.
+    
+    Args:
+        traders: Sequence of trader names
+        texts: Sequence of message texts, one per trader
+        
+    Returns:
+        numpy.ndarray: Boolean array, True where the trader matched its text
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is required for batch matching")
+    
+    texts_lower = np.char.lower(np.asarray(texts, dtype=str))
+    # One column of lowercased variations per variation rule
+    variations = np.array([[lowered for _, lowered in _trader_variations(trader)] for trader in traders], dtype=str)
+    
+    matched = np.zeros(len(traders), dtype=bool)
+    for column in variations.T:
+        matched |= np.char.find(texts_lower, column) >= 0
+    return matched
+
 def main():
     """Main test function"""
     print("=== TRADER MATCHING TEST ===")
@@ -65,6 +121,13 @@ def main():
         else:
             print(f"❌ TEST FAILED: Got {result}, expected {expected}")
     
+    # Run the same cases again as one vectorized batch
+    if NUMPY_AVAILABLE:
+        traders, texts, expected = zip(*test_cases)
+        results = match_traders_batch(traders, texts)
+        passed = int((results == np.array(expected)).sum())
+        print(f"\nBatch check: {passed}/{len(test_cases)} cases matched the expected result")
+    
     print("\n=== TEST COMPLETE ===")
 
 if __name__ == "__main__":
@@ -6,7 +6,28 @@ Tests the improved log pattern matching for server/channel status
 
 import re
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, messagebox
+
+# Detection phrases to look for in the log, grouped by the indicator they report
+_DETECTION_PHRASES = {
+    'exact': ["INFO - ✅ Discord 'Wealth Group' server and 'trades' channel detected!"],
+    'full': ["✅ Discord 'Wealth Group' server and 'trades' channel detected!"],
+    'alt': ["Discord 'Wealth Group' server and 'trades' channel detected"],
+    'indicators': ["Found indicators: Discord"],
+    'wealth': ["Wealth Group"],
+    'trades_channel': ["trades channel"],
+    'server': ["'Wealth Group' server", "Target server 'Wealth Group'"],
+    'channel': ["# trades", "channel: trades"],
+    'inferred': ["Target channel 'trades' inferred from"],
+    'discord': ["Discord detected"],
+}
+
+# Every detection phrase compiled once into one pattern, so the log is scanned in a single pass.
+# Each alternative sits in a lookahead so overlapping phrases are all reported.
+_DETECT_RE = re.compile("(?=(?:{}))".format("|".join(
+    f"(?P<{name}>{'|'.join(map(re.escape, phrases))})"
+    for name, phrases in _DETECTION_PHRASES.items()
+)))
 
 class TestUI:
     """Simple test UI to verify the enhanced detection pattern matching"""
@@ -21,8 +42,20 @@ class TestUI:
         self.log_frame = ttk.LabelFrame(self.root, text="Log Output")
         self.log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        self.log_text = scrolledtext.ScrolledText(self.log_frame, wrap=tk.WORD)
-        self.log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Plain Text widget with no undo stack or edit separators: the log is append-only
+        # and trimmed text should be freed
+        log_container = ttk.Frame(self.log_frame)
+        log_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.log_text = tk.Text(log_container, wrap=tk.WORD, undo=False, autoseparators=False, maxundo=0)
+        log_scrollbar = ttk.Scrollbar(log_container, orient=tk.VERTICAL, command=self.log_text.yview)
+        self.log_text.configure(yscrollcommand=log_scrollbar.set)
+        
+        log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Keep at most this many lines; older lines are dropped as samples are added
+        self._max_lines = 500
         
         # Test controls
         control_frame = ttk.Frame(self.root)
@@ -40,6 +73,10 @@ class TestUI:
         ttk.Button(control_frame, text="Test Detection", 
                   command=self.test_detection).pack(side=tk.LEFT, padx=20)
         
+        # Clear log button
+        ttk.Button(control_frame, text="Clear Log", 
+                  command=self.clear_log).pack(side=tk.LEFT, padx=5)
+        
         # Status display
         status_frame = ttk.LabelFrame(self.root, text="Detection Status")
         status_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -55,6 +92,12 @@ class TestUI:
         
         self.channel_status = ttk.Label(status_frame, text="Channel: Not Detected")
         self.channel_status.pack(pady=5)
+        
+        # Phrases found so far and a mark where the next scan starts, so each test only scans
+        # new log text (the mark stays in place when old lines are trimmed)
+        self._found = set()
+        self.log_text.mark_set("scan_start", "1.0")
+        self.log_text.mark_gravity("scan_start", tk.LEFT)
     
     def add_sample_log(self, sample_num):
         """Add a sample log to the text widget"""
@@ -84,13 +127,35 @@ class TestUI:
 2025-04-21 14:10:31,012 - ui.enhanced_trading_ui - INFO - Discord detection successful via screen_capture method
             """)
         
+        # Drop the oldest lines beyond the cap
+        # Tk counts the lines itself (returns a 1-tuple, or None when there are none)
+        lines = (self.log_text.count("1.0", "end", "lines") or (0,))[0]
+        if lines > self._max_lines:
+            self.log_text.delete("1.0", f"{lines - self._max_lines + 1}.0")
+        
         self.log_text.config(state=tk.DISABLED)
         self.log_text.see(tk.END)
     
+    def clear_log(self):
+        """Clear the log text and reset the detection scan"""
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.delete("1.0", tk.END)
+        self.log_text.config(state=tk.DISABLED)
+        
+        self._found = set()
+        self.log_text.mark_set("scan_start", "1.0")
+    
     def test_detection(self):
         """Test the enhanced detection logic against current logs"""
-        # Get the log content
-        log_content = self.log_text.get("1.0", tk.END)
+        # Get the log content added since the last test
+        log_content = self.log_text.get("scan_start", tk.END)
+        
+        # Collect every detection phrase present in the new text in a single pass
+        found = self._found
+        found.update(match.lastgroup for match in _DETECT_RE.finditer(log_content))
+        
+        # Rescan the last line next time in case more text is appended to it
+        self.log_text.mark_set("scan_start", "end-1c linestart")
         
         # Set initial detection values
         discord_detected = False
@@ -98,40 +163,38 @@ class TestUI:
         channel_detected = False
         
         # Check for direct full detection message with checkmark emoji
-        if "✅ Discord 'Wealth Group' server and 'trades' channel detected!" in log_content:
+        if 'full' in found:
             discord_detected = True
             server_detected = True
             channel_detected = True
             self.status_label.config(text="Full detection confirmed via checkmark pattern")
         
         # Check for alternative message format
-        elif "Discord 'Wealth Group' server and 'trades' channel detected" in log_content:
+        elif 'alt' in found:
             discord_detected = True
             server_detected = True
             channel_detected = True
             self.status_label.config(text="Full detection confirmed via alternative pattern")
         
         # Check for the Found indicators pattern we're seeing in the logs
-        elif "Found indicators: Discord" in log_content and "Wealth Group" in log_content and "trades channel" in log_content:
+        elif 'indicators' in found and 'wealth' in found and 'trades_channel' in found:
             discord_detected = True
             server_detected = True
             channel_detected = True
             self.status_label.config(text="Full detection confirmed via indicators list")
         
         # Check individual indicators and inferences
-        elif "Discord detected" in log_content:
+        elif 'discord' in found:
             discord_detected = True
             
             # Check server detection
-            server_indicators = ["'Wealth Group' server", "Target server 'Wealth Group'"]
-            server_detected = any(indicator in log_content for indicator in server_indicators)
+            server_detected = 'server' in found
             
             # Check channel detection
-            channel_indicators = ["trades channel", "# trades", "channel: trades"]
-            channel_detected = any(indicator in log_content for indicator in channel_indicators)
+            channel_detected = 'channel' in found or 'trades_channel' in found
             
             # Check for inferred detection
-            if "Target channel 'trades' inferred from" in log_content:
+            if 'inferred' in found:
                 channel_detected = True
                 self.status_label.config(text="Partial detection with inference")
             else:
@@ -145,7 +208,7 @@ class TestUI:
         self.channel_status.config(text=f"Channel: {'Detected' if channel_detected else 'Not Detected'}")
         
         # Test our exact fix for the specific pattern in the log
-        if "INFO - ✅ Discord 'Wealth Group' server and 'trades' channel detected!" in log_content:
+        if 'exact' in found:
             messagebox.showinfo("Test Result", "Exact pattern match success! The fix should work.")
         
         # Mark pattern successful or not